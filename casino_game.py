@@ -6,61 +6,204 @@ with unique rules: 40-card deck, face-up capture piles, and opponent pile intera
 
 import random
 from typing import List, Dict, Tuple, Optional, Union
-from enum import Enum
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from collections import defaultdict
-import copy
+from functools import lru_cache
 
-class Suit(Enum):
-    """Card suits with their display symbols"""
-    SPADES = '♠'
-    HEARTS = '♥'
-    DIAMONDS = '♦'
-    CLUBS = '♣'
+# Card suits as plain ints (enum member access is far slower in hot loops),
+# with their display symbols indexed by suit
+SPADES, HEARTS, DIAMONDS, CLUBS = 0, 1, 2, 3
+SUIT_SYMBOLS = ('♠', '♥', '♦', '♣')
 
+def _build_rank_table() -> Dict[str, Tuple[Tuple[int, ...], int, str]]:
+    """Precompute (values, numeric_value, display_rank) for every rank"""
+    table = {'A': ((1, 14), 1, 'A')}  # Ace can be 1 or 14
+    for rank, value in [('J', 11), ('Q', 12), ('K', 13)]:
+        table[rank] = ((value,), value, rank)
+    for value in range(2, 11):  # 2-10
+        rank = str(value)
+        table[rank] = ((value,), value, rank)
+    return table
+
+_RANK_TABLE = _build_rank_table()
+
+# Flyweight cache: only 40 or 52 distinct cards ever exist, so constructing
+# them once and sharing the instances avoids per-card setup work in deck
+# builds and state copies.
+_CARD_POOL: Dict[Tuple[str, int], 'Card'] = {}
+
+@dataclass(frozen=True, slots=True)
 class Card:
     """Represents a playing card with South African Casino specific values"""
-    
-    def __init__(self, rank: str, suit: Suit):
-        self.rank = rank
-        self.suit = suit
-        self._set_values()
-    
-    def _set_values(self):
-        """Set the numerical values for gameplay"""
-        if self.rank == 'A':
-            self.values = [1, 14]  # Ace can be 1 or 14
-            self.display_rank = 'A'
-            self.numeric_value = 1
-        elif self.rank in ['J', 'Q', 'K']:
-            self.display_rank = self.rank
-            if self.rank == 'J':
-                self.values = [11]
-                self.numeric_value = 11
-            elif self.rank == 'Q':
-                self.values = [12]
-                self.numeric_value = 12
-            else:  # K
-                self.values = [13]
-                self.numeric_value = 13
-        else:  # 2-10
-            self.display_rank = self.rank
-            value = int(self.rank)
-            self.values = [value]
-            self.numeric_value = value
-    
+    rank: str
+    suit: int
+    # Derived gameplay values, precomputed per rank; excluded from
+    # equality/hashing so cards still compare by (rank, suit).
+    values: Tuple[int, ...] = field(init=False, compare=False, repr=False)
+    numeric_value: int = field(init=False, compare=False, repr=False)
+    display_rank: str = field(init=False, compare=False, repr=False)
+    index: int = field(init=False, compare=False, repr=False)  # stable 0..51
+    _repr: str = field(init=False, compare=False, repr=False)
+
+    def __post_init__(self):
+        values, numeric_value, display_rank = _RANK_TABLE[self.rank]
+        object.__setattr__(self, 'values', values)
+        object.__setattr__(self, 'numeric_value', numeric_value)
+        object.__setattr__(self, 'display_rank', display_rank)
+        object.__setattr__(self, 'index', self.suit * 13 + numeric_value - 1)
+        object.__setattr__(self, '_repr', f"{display_rank}{SUIT_SYMBOLS[self.suit]}")
+
+    @classmethod
+    def get(cls, rank: str, suit: int) -> 'Card':
+        """Get the shared (flyweight) instance for a rank/suit pair"""
+        key = (rank, suit)
+        card = _CARD_POOL.get(key)
+        if card is None:
+            card = _CARD_POOL.setdefault(key, cls(rank, suit))
+        return card
+
     def __repr__(self):
-        return f"{self.display_rank}{self.suit.value}"
-    
-    def __eq__(self, other):
-        if not isinstance(other, Card):
-            return False
-        return self.rank == other.rank and self.suit == other.suit
-    
-    def __hash__(self):
-        return hash((self.rank, self.suit))
+        return self._repr
+
+# Every card has a stable index (suit * 13 + numeric_value - 1); this table
+# rehydrates an index back into its flyweight Card, letting hot code pass
+# around small ints or bitmasks instead of object references
+_RANKS_BY_VALUE = ('A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K')
+_CARDS_BY_IDX = tuple(Card.get(rank, suit)
+                      for suit in (SPADES, HEARTS, DIAMONDS, CLUBS)
+                      for rank in _RANKS_BY_VALUE)
+
+# Special cards for scoring
+SPY_TWO = Card.get('2', SPADES)
+BIG_TEN = Card.get('10', DIAMONDS)
+
+# With piles packed as 52-bit masks over card indexes, suit/rank statistics
+# are one AND plus a popcount
+_SPADES_MASK = sum(1 << card.index for card in _CARDS_BY_IDX if card.suit == SPADES)
+_ACES_MASK = sum(1 << card.index for card in _CARDS_BY_IDX if card.rank == 'A')
+
+# No capture or build total exceeds an ace counted high, so any subset
+# whose sums all pass this can never match and is pruned outright
+_MAX_CAPTURE_TOTAL = 14
+_USEFUL_TOTALS = (1 << (_MAX_CAPTURE_TOTAL + 1)) - 1
+
+@lru_cache(maxsize=1024)
+def _enumerate_subset_totals(value_groups: Tuple[Tuple[int, ...], ...]) -> Tuple[Tuple[int, int], ...]:
+    """
+    (mask, totals) pairs for every non-empty subset of cards that can
+    still reach a useful total.
+
+    `mask` is a bitmask over value_groups and bit t of `totals` is set
+    when the masked cards can sum to t (adding a card is just
+    `totals << value`). Sums above _MAX_CAPTURE_TOTAL are discarded, and
+    once a subset has no useful sum left neither does any superset --
+    values only grow sums -- so its whole branch is skipped. That keeps
+    the enumeration proportional to the small-sum subsets rather than
+    2^n: a layout drifted out to dozens of loose cards stays cheap where
+    a dense table over all masks would exhaust memory. Pairs come back
+    sorted by mask, matching the old ascending scan, and the result is
+    cached so one played turn reuses the sweep across all hand cards.
+    """
+    n = len(value_groups)
+    results = []
+    # DFS over subsets: grow each live subset with every later card
+    stack = [(0, 0, 1)]  # (next card index, mask, reachable totals)
+    while stack:
+        start, mask, totals = stack.pop()
+        for i in range(start, n):
+            values = value_groups[i]
+            if len(values) == 1:  # common case: every rank but the Ace
+                extended = totals << values[0] & _USEFUL_TOTALS
+            else:
+                extended = 0
+                for value in values:
+                    extended |= totals << value
+                extended &= _USEFUL_TOTALS
+            if extended:
+                grown = mask | 1 << i
+                results.append((grown, extended))
+                stack.append((i + 1, grown, extended))
+    results.sort()
+    return tuple(results)
+
+@lru_cache(maxsize=None)
+def _initial_deck(use_40_card_deck: bool) -> Tuple[Card, ...]:
+    """The unshuffled deck for a variant, built once and reused"""
+    suits = [SPADES, HEARTS, DIAMONDS, CLUBS]
+    ranks = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
+
+    if use_40_card_deck:
+        # Remove Jacks, Queens, and Kings for South African variant
+        ranks = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'A']
 
-@dataclass
+    return tuple(Card.get(rank, suit) for suit in suits for rank in ranks)
+
+_BANNER = "=" * 50
+_ROUND_BANNER = "=" * 30
+
+# Upper bound on per-game transposition entries for capture lookups
+_CAPTURE_CACHE_SIZE = 1 << 15
+
+def _no_log(*args, **kwargs):
+    """Output sink used in place of print when a game is not verbose"""
+
+def _format_pile(pile: List[Card]) -> str:
+    """
+    Join the cached card reprs directly instead of going through
+    list.__repr__, and only when actually asked to format (the summary
+    block is verbose-gated, so silent games never stringify a pile).
+    """
+    return ", ".join(map(str, pile))
+
+@lru_cache(maxsize=4096)
+def _capture_masks(value_groups: Tuple[Tuple[int, ...], ...], target: int) -> Tuple[int, ...]:
+    """
+    Bitmasks of the multi-card subsets of value_groups that sum to target.
+
+    Memoized on (value multiset, target): layouts repeat the same rank
+    patterns constantly, so most turns answer straight from the cache
+    without rescanning the 2^n masks.
+    """
+    # Cards whose smallest value already exceeds the target can never be
+    # part of a summing subset, so run the DP only over the eligible ones
+    # and remap the resulting masks to the original positions
+    eligible = [i for i, values in enumerate(value_groups) if values[0] <= target]
+    pairs = _enumerate_subset_totals(tuple(value_groups[i] for i in eligible))
+
+    masks = []
+    for mask, totals in pairs:
+        if mask & (mask - 1) and totals >> target & 1:
+            full_mask = 0
+            remaining = mask
+            while remaining:
+                bit = remaining & -remaining
+                full_mask |= 1 << eligible[bit.bit_length() - 1]
+                remaining ^= bit
+            masks.append(full_mask)
+    return tuple(masks)
+
+@lru_cache(maxsize=4096)
+def _build_options(value_groups: Tuple[Tuple[int, ...], ...],
+                   played_values: Tuple[int, ...],
+                   capture_values: frozenset) -> Tuple[Tuple[int, int], ...]:
+    """
+    (mask, total) pairs for build creation: subsets of value_groups whose
+    total including the played card matches one of capture_values. Each
+    mask reports its smallest matching total, mirroring the original
+    ascending scan.
+    """
+    options = []
+    for mask, subset_totals in _enumerate_subset_totals(value_groups):
+        totals = 0
+        for value in played_values:
+            totals |= subset_totals << value
+        for total in range(totals.bit_length()):
+            if totals >> total & 1 and total in capture_values:
+                options.append((mask, total))
+                break
+    return tuple(options)
+
+@dataclass(slots=True)
 class Build:
     """Represents a build (single or augmented) in the layout"""
     cards: List[Card]
@@ -74,7 +217,12 @@ class Build:
 
 class Player:
     """Represents a player in the game"""
-    
+
+    # Fixed attribute set: slots drop the per-instance dict and make
+    # attribute access a C-level descriptor lookup
+    __slots__ = ('name', 'id', 'hand', 'capture_pile', 'score', 'is_ai',
+                 'last_capture', 'capture_mask')
+
     def __init__(self, name: str, player_id: int, is_ai: bool = False):
         self.name = name
         self.id = player_id
@@ -83,6 +231,9 @@ class Player:
         self.score = 0
         self.is_ai = is_ai
         self.last_capture = False
+        # Packed view of the capture pile (bit card.index per card), kept
+        # in sync by capture_cards so scoring never rescans the pile
+        self.capture_mask = 0
     
     def add_to_hand(self, card: Card):
         """Add a card to player's hand"""
@@ -96,6 +247,10 @@ class Player:
     
     def capture_cards(self, cards: List[Card]):
         """Add captured cards to face-up pile (top card visible)"""
+        mask = self.capture_mask
+        for card in cards:
+            mask |= 1 << card.index
+        self.capture_mask = mask
         self.capture_pile.extend(cards)
     
     def get_top_card(self) -> Optional[Card]:
@@ -110,8 +265,18 @@ class Player:
     
     def count_spades(self) -> int:
         """Count spades in capture pile"""
-        return sum(1 for card in self.capture_pile if card.suit == Suit.SPADES)
+        return (self.capture_mask & _SPADES_MASK).bit_count()
     
+    def clone(self) -> 'Player':
+        """Copy this player for simulation (Card instances are shared)"""
+        new_player = Player(self.name, self.id, self.is_ai)
+        new_player.hand = list(self.hand)
+        new_player.capture_pile = list(self.capture_pile)
+        new_player.score = self.score
+        new_player.last_capture = self.last_capture
+        new_player.capture_mask = self.capture_mask
+        return new_player
+
     def has_card(self, card: Card) -> bool:
         """Check if player has specific card in hand"""
         return any(c == card for c in self.hand)
@@ -122,15 +287,17 @@ class Player:
 class SouthAfricanCasinoGame:
     """Main game engine implementing South African Casino rules"""
     
-    def __init__(self, num_players: int = 2, use_40_card_deck: bool = True, 
-                 partnerships: Optional[List[Tuple[int, int]]] = None):
+    def __init__(self, num_players: int = 2, use_40_card_deck: bool = True,
+                 partnerships: Optional[List[Tuple[int, int]]] = None,
+                 verbose: bool = True):
         """
         Initialize a new game of South African Casino
-        
+
         Args:
             num_players: 2, 3, or 4 players
             use_40_card_deck: If True, removes J, Q, K (South African variant)
             partnerships: List of tuples for 4-player partnerships
+            verbose: If False, suppress all output (for AI self-play)
         """
         if num_players not in [2, 3, 4]:
             raise ValueError("Number of players must be 2, 3, or 4")
@@ -139,18 +306,47 @@ class SouthAfricanCasinoGame:
         self.use_40_card_deck = use_40_card_deck
         self.partnerships = partnerships
         self.is_partnership_game = partnerships is not None
-        
+        # Partner lookup by player id, so partnership checks are a single
+        # list index instead of scanning the pairs
+        self._partner_of: List[Optional[int]] = [None] * num_players
+        # Scoring key by player id, fixed for the life of the game: a
+        # partnership's two seats share one sorted id tuple, solo players
+        # score under their own id. calculate_scores indexes this instead
+        # of re-sorting partner pairs on every call.
+        self._team_key: List[Union[int, Tuple[int, int]]] = list(range(num_players))
+        if partnerships:
+            for p1, p2 in partnerships:
+                self._partner_of[p1] = p2
+                self._partner_of[p2] = p1
+                key = (p1, p2) if p1 < p2 else (p2, p1)
+                self._team_key[p1] = key
+                self._team_key[p2] = key
+
         # Game state
         self.deck: List[Card] = []
         self.players: List[Player] = []
         self.layout: List[Union[Card, Build]] = []  # Can contain loose cards or builds
+        # Incremental views of the layout, kept in sync by the mutators so
+        # queries avoid rescanning with isinstance checks
+        self._loose: List[Card] = []
+        self._builds: List[Build] = []
+        self.loose_mask = 0  # bit card.index per loose card, for O(1) membership
+        # Loose cards bucketed by numeric value, so rank-match queries skip
+        # the layout scan; index 1..13
+        self._loose_by_value: List[List[Card]] = [[] for _ in range(14)]
+        # Transposition table: identical (layout, played value) states recur
+        # across turns and rollouts, so capture groups are cached with LRU
+        # eviction; loose_mask makes the state key exact
+        self._capture_cache: 'OrderedDict[tuple, list]' = OrderedDict()
         self.current_player = 0
         self.game_phase = "setup"  # setup, playing, scoring
         self.turn_history = []
+        self.verbose = verbose  # False for AI-vs-AI simulation runs
+        self._log = print if verbose else _no_log
         
         # Special cards for scoring
-        self.spy_two = Card('2', Suit.SPADES)
-        self.big_ten = Card('10', Suit.DIAMONDS)
+        self.spy_two = SPY_TWO
+        self.big_ten = BIG_TEN
         
         # Statistics
         self.captures_this_turn = []
@@ -161,16 +357,52 @@ class SouthAfricanCasinoGame:
     
     def _create_deck(self):
         """Create and shuffle the deck (52 or 40 cards)"""
-        suits = [Suit.SPADES, Suit.HEARTS, Suit.DIAMONDS, Suit.CLUBS]
-        ranks = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
-        
-        if self.use_40_card_deck:
-            # Remove Jacks, Queens, and Kings for South African variant
-            ranks = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'A']
-        
-        self.deck = [Card(rank, suit) for suit in suits for rank in ranks]
+        self.deck = list(_initial_deck(self.use_40_card_deck))
         random.shuffle(self.deck)
     
+    def clone(self) -> 'SouthAfricanCasinoGame':
+        """
+        Fast copy of the game state for AI rollouts.
+
+        Cards are immutable flyweights and stay shared; only the mutable
+        containers (deck, hands, piles, layout, builds) are copied.
+        Avoids the generic deepcopy dispatch, which is far slower on this
+        object graph.
+        """
+        new_game = SouthAfricanCasinoGame.__new__(SouthAfricanCasinoGame)
+        new_game.num_players = self.num_players
+        new_game.use_40_card_deck = self.use_40_card_deck
+        new_game.partnerships = self.partnerships
+        new_game.is_partnership_game = self.is_partnership_game
+        new_game._partner_of = self._partner_of  # never mutated after init
+        new_game._team_key = self._team_key
+        new_game.deck = list(self.deck)
+        new_game.players = [player.clone() for player in self.players]
+
+        # Copy builds once so layout and _builds reference the same objects
+        copied_builds = {id(build): Build(list(build.cards), build.total_value,
+                                          build.owner, build.is_augmented)
+                         for build in self._builds}
+        new_game.layout = [item if isinstance(item, Card) else copied_builds[id(item)]
+                           for item in self.layout]
+        new_game._loose = list(self._loose)
+        new_game.loose_mask = self.loose_mask
+        new_game._loose_by_value = [list(bucket) for bucket in self._loose_by_value]
+        new_game._capture_cache = OrderedDict()  # keys embed build identities
+        new_game._builds = [copied_builds[id(build)] for build in self._builds]
+
+        new_game.current_player = self.current_player
+        new_game.game_phase = self.game_phase
+        new_game.verbose = self.verbose
+        new_game._log = self._log
+        new_game.turn_history = list(self.turn_history)
+        new_game.spy_two = self.spy_two
+        new_game.big_ten = self.big_ten
+        new_game.captures_this_turn = list(self.captures_this_turn)
+        new_game.builds_created = [copied_builds.get(id(build), build)
+                                   for build in self.builds_created]
+        return new_game
+
     def _create_players(self):
         """Create player objects"""
         player_names = ["Player 1", "Player 2", "Player 3", "Player 4"]
@@ -183,36 +415,84 @@ class SouthAfricanCasinoGame:
         middle = len(self.deck) // 2
         start = middle - 2
         end = middle + 2
-        return [self.deck.pop(start) for _ in range(4)]
+        # Slice out the middle in one shot rather than four pop() shifts
+        cards = self.deck[start:end]
+        del self.deck[start:end]
+        return cards
     
+    def reset(self, seed: Optional[int] = None):
+        """
+        Reset this game object for a fresh hand, reusing the existing
+        players and containers so repeated playouts avoid reallocation.
+        """
+        if seed is not None:
+            random.seed(seed)
+        self._create_deck()
+
+        for player in self.players:
+            player.hand.clear()
+            player.capture_pile.clear()
+            player.capture_mask = 0
+            player.score = 0
+            player.last_capture = False
+
+        self.layout.clear()
+        self._loose.clear()
+        self._builds.clear()
+        self.loose_mask = 0
+        for bucket in self._loose_by_value:
+            bucket.clear()
+        self._capture_cache.clear()
+        self.current_player = 0
+        self.game_phase = "setup"
+        self.turn_history.clear()
+        self.captures_this_turn = []
+        self.builds_created = []
+
     def setup_game(self):
         """Set up the initial game state"""
         # Create initial layout by cutting 4 cards from middle
         layout_cards = self._cut_deck()
         self.layout.extend(layout_cards)
+        for card in layout_cards:
+            self._add_loose(card)
         
-        # Deal remaining cards to players
-        while self.deck:
-            for player in self.players:
-                if self.deck:
-                    player.add_to_hand(self.deck.pop())
+        # Deal remaining cards to players: one strided slice per player
+        # instead of popping the deck card by card (dealing order from the
+        # top of the deck is preserved)
+        dealt = self.deck[::-1]
+        for i, player in enumerate(self.players):
+            player.hand = dealt[i::self.num_players]
+        self.deck.clear()
         
         # Determine starting player (right of dealer)
         self.current_player = 0
         self.game_phase = "playing"
         
-        print("Game setup complete!")
-        print(f"Initial layout: {self.layout}")
+        self._log("Game setup complete!")
+        self._log(f"Initial layout: {self.layout}")
         for player in self.players:
-            print(f"{player.name}: {len(player.hand)} cards")
+            self._log(f"{player.name}: {len(player.hand)} cards")
     
+    def _add_loose(self, card: Card):
+        """Register a card in the incremental loose-card indexes"""
+        self._loose.append(card)
+        self.loose_mask |= 1 << card.index
+        self._loose_by_value[card.numeric_value].append(card)
+
+    def _remove_loose(self, card: Card):
+        """Remove a card from the incremental loose-card indexes"""
+        self._loose.remove(card)
+        self.loose_mask &= ~(1 << card.index)
+        self._loose_by_value[card.numeric_value].remove(card)
+
     def get_loose_cards(self) -> List[Card]:
         """Get all loose cards (not in builds) from layout"""
-        return [item for item in self.layout if isinstance(item, Card)]
-    
+        return self._loose
+
     def get_builds(self) -> List[Build]:
         """Get all builds from layout"""
-        return [item for item in self.layout if isinstance(item, Build)]
+        return self._builds
     
     def get_owned_builds(self, player_id: int) -> List[Build]:
         """Get builds owned by specific player"""
@@ -223,62 +503,100 @@ class SouthAfricanCasinoGame:
         Calculate all possible total values from cards.
         Ace can count as 1 or 14.
         """
-        totals = set([0])
-        
-        for card in cards:
-            new_totals = set()
-            for total in totals:
-                for value in card.values:
-                    new_totals.add(total + value)
-            totals = new_totals
-        
-        return sorted(list(totals))
-    
+        # The same multiset of ranks recurs thousands of times per turn
+        # across combination scans, so cache on the sorted value tuples.
+        return self._calc_total_cached(tuple(sorted(card.values for card in cards)))
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _calc_total_cached(value_groups: Tuple[Tuple[int, ...], ...]) -> List[int]:
+        """Compute all reachable totals for a sorted tuple of value tuples"""
+        # Totals are small bounded ints, so reachability lives in the bits
+        # of a single int: adding a card is two shifts and an OR
+        reachable = 1  # bit 0: the empty total
+        for values in value_groups:
+            new = 0
+            for value in values:
+                new |= reachable << value
+            reachable = new
+
+        return [total for total in range(reachable.bit_length())
+                if reachable >> total & 1]
+
+    def _has_any_capture(self, played_card: Card) -> bool:
+        """
+        Cheap check for whether the played card captures anything at all,
+        without materializing the capture groups.
+        """
+        target = played_card.numeric_value
+        loose_cards = self._loose
+
+        if self._loose_by_value[target]:
+            return True
+        for build in self._builds:
+            if target == build.total_value:
+                return True
+            for card in loose_cards:
+                if any(value + build.total_value == target for value in card.values):
+                    return True
+
+        return bool(_capture_masks(tuple(card.values for card in loose_cards), target))
+
     def find_captures(self, played_card: Card, player: Player) -> List[List[Union[Card, Build]]]:
         """
         Find all possible captures with the played card.
         Returns list of capture groups (cards/builds that can be captured together).
         """
-        capture_groups = []
-        
-        # Get all possible capture targets
-        all_targets = self.get_loose_cards() + self.get_builds()
-        
-        # Check for single card matches
-        for target in all_targets:
-            if isinstance(target, Card):
-                if played_card.numeric_value == target.numeric_value:
-                    capture_groups.append([target])
-            elif isinstance(target, Build):  # Can capture any build regardless of owner
-                if played_card.numeric_value == target.total_value:
-                    capture_groups.append([target])
-        
-        # Check for multiple loose cards that sum to played card value
+        target = played_card.numeric_value
         loose_cards = self.get_loose_cards()
+        builds = self.get_builds()
+
+        # Transposition lookup: the result only depends on the loose set,
+        # the builds and their totals, and the played value
+        cache_key = (self.loose_mask,
+                     tuple((id(build), build.total_value) for build in builds),
+                     target)
+        cached = self._capture_cache.get(cache_key)
+        if cached is not None:
+            self._capture_cache.move_to_end(cache_key)
+            return cached
+
+        capture_groups = []
+
+        # Check for single card matches, straight from the value index
+        for card in self._loose_by_value[target]:
+            capture_groups.append([card])
+        for build in builds:  # Can capture any build regardless of owner
+            if target == build.total_value:
+                capture_groups.append([build])
+
+        # Check for multiple loose cards that sum to played card value,
+        # straight from the memoized per-target subset masks
         n = len(loose_cards)
-        
-        # Check all combinations of loose cards
-        from itertools import combinations
-        for r in range(2, n + 1):
-            for combo in combinations(loose_cards, r):
-                combo_list = list(combo)
-                totals = self.calculate_total(combo_list)
-                if played_card.numeric_value in totals:
-                    capture_groups.append(combo_list)
-        
-        # Check for combinations including builds
-        for build in self.get_builds():
-            # Build + loose cards
-            for combo in combinations(loose_cards, 1):  # Start with 1 loose card
-                combo_list = list(combo) + [build]
-                totals = self.calculate_total([c for c in combo_list if isinstance(c, Card)])
-                # Add build value
-                adjusted_totals = [t + build.total_value for t in totals]
-                if played_card.numeric_value in adjusted_totals:
-                    capture_groups.append(combo_list)
-        
-        return capture_groups
-    
+        for mask in _capture_masks(tuple(card.values for card in loose_cards), target):
+            capture_groups.append([loose_cards[i] for i in range(n) if mask >> i & 1])
+
+        # Check for combinations including builds (one loose card + build)
+        for build in builds:
+            for card in loose_cards:
+                if any(value + build.total_value == target for value in card.values):
+                    capture_groups.append([card, build])
+
+        # Drop duplicate groups (same cards/builds reached via different
+        # paths) so the AI never re-evaluates an identical capture
+        seen = set()
+        unique_groups = []
+        for group in capture_groups:
+            key = tuple(sorted(id(item) for item in group))
+            if key not in seen:
+                seen.add(key)
+                unique_groups.append(group)
+
+        self._capture_cache[cache_key] = unique_groups
+        if len(self._capture_cache) > _CAPTURE_CACHE_SIZE:
+            self._capture_cache.popitem(last=False)
+        return unique_groups
+
     def can_create_build(self, played_card: Card, player: Player) -> List[Dict]:
         """
         Check if player can create a build with the played card.
@@ -286,33 +604,25 @@ class SouthAfricanCasinoGame:
         """
         possible_builds = []
         loose_cards = self.get_loose_cards()
-        
-        # Check all combinations of loose cards + played card
-        from itertools import combinations
-        
+        n = len(loose_cards)
+
         # Player must have a card in hand to capture the build later
-        available_capture_values = [card.numeric_value for card in player.hand 
-                                   if card != played_card]
-        
-        for r in range(1, len(loose_cards) + 1):
-            for combo in combinations(loose_cards, r):
-                combo_cards = list(combo)
-                all_cards = combo_cards + [played_card]
-                
-                # Calculate all possible totals
-                totals = self.calculate_total(all_cards)
-                
-                # Check if player has a card to capture any of these totals
-                for total in totals:
-                    if total in available_capture_values:
-                        possible_builds.append({
-                            'cards': combo_cards,
-                            'played_card': played_card,
-                            'total_value': total,
-                            'type': 'single'
-                        })
-                        break
-        
+        # (a frozenset makes the per-total membership test O(1); cards are
+        # flyweights, so identity stands in for equality)
+        available_capture_values = frozenset(card.numeric_value for card in player.hand
+                                             if card is not played_card)
+
+        # The whole sweep is memoized on the value multisets: each cached
+        # (mask, total) pair is one buildable combination of loose cards
+        for mask, total in _build_options(tuple(card.values for card in loose_cards),
+                                          played_card.values, available_capture_values):
+            possible_builds.append({
+                'cards': [loose_cards[i] for i in range(n) if mask >> i & 1],
+                'played_card': played_card,
+                'total_value': total,
+                'type': 'single'
+            })
+
         return possible_builds
     
     def can_augment_build(self, played_card: Card, player: Player) -> List[Dict]:
@@ -322,7 +632,12 @@ class SouthAfricanCasinoGame:
         """
         possible_augmentations = []
         builds = self.get_builds()
-        
+
+        # Player must have a card in hand to capture the build later;
+        # computed once here instead of per build
+        available_capture_values = frozenset(card.numeric_value for card in player.hand
+                                             if card is not played_card)
+
         # Get top cards from opponents' capture piles (South African rule!)
         opponent_top_cards = []
         for i, opp_player in enumerate(self.players):
@@ -341,9 +656,7 @@ class SouthAfricanCasinoGame:
                 # Calculate new possible totals with played card
                 # Player must have a card matching the new total
                 new_totals = self.calculate_total(build.cards + [played_card])
-                available_capture_values = [card.numeric_value for card in player.hand 
-                                           if card != played_card]
-                
+
                 for new_total in new_totals:
                     if new_total in available_capture_values:
                         possible_augmentations.append({
@@ -379,9 +692,7 @@ class SouthAfricanCasinoGame:
     
     def _are_partners(self, player1_id: int, player2_id: int) -> bool:
         """Check if two players are partners"""
-        if not self.partnerships:
-            return False
-        return any(set(pair) == {player1_id, player2_id} for pair in self.partnerships)
+        return self._partner_of[player1_id] == player2_id
     
     def execute_capture(self, player: Player, played_card: Card, 
                        capture_group: List[Union[Card, Build]]) -> bool:
@@ -398,10 +709,12 @@ class SouthAfricanCasinoGame:
             if isinstance(item, Card):
                 cards_to_capture.append(item)
                 self.layout.remove(item)
+                self._remove_loose(item)
             elif isinstance(item, Build):
                 # Capture all cards in the build
                 cards_to_capture.extend(item.cards)
                 self.layout.remove(item)
+                self._builds.remove(item)
         
         # Add played card and captured cards to player's pile
         all_captured = [played_card] + cards_to_capture
@@ -443,9 +756,11 @@ class SouthAfricanCasinoGame:
             # Remove used cards from layout
             for card in build_config['cards']:
                 self.layout.remove(card)
-            
+                self._remove_loose(card)
+
             # Add new build to layout
             self.layout.append(new_build)
+            self._builds.append(new_build)
             self.builds_created.append(new_build)
             
             return True
@@ -470,8 +785,9 @@ class SouthAfricanCasinoGame:
                 augmenting_card = build_config['augmenting_card']
                 
                 # Check if we need to remove augmenting card from layout
-                if augmenting_card in self.get_loose_cards():
+                if self.loose_mask >> augmenting_card.index & 1:
                     self.layout.remove(augmenting_card)
+                    self._remove_loose(augmenting_card)
                 
                 # Add cards to build
                 build.cards.append(played_card)
@@ -485,7 +801,9 @@ class SouthAfricanCasinoGame:
     def discard_card(self, player: Player, played_card: Card):
         """Discard a card to the layout"""
         self.layout.append(played_card)
-        print(f"{player.name} discarded {played_card}")
+        self._add_loose(played_card)
+        if self.verbose:  # skip the f-string entirely in silent games
+            self._log(f"{player.name} discarded {played_card}")
     
     def get_ai_move(self, player: Player) -> Tuple[Optional[int], Optional[Union[List, Dict]]]:
         """
@@ -496,10 +814,11 @@ class SouthAfricanCasinoGame:
         if not player.hand:
             return None, None
         
-        # Try to find captures first
+        # Try to find captures first; only build the full capture groups
+        # for the card that actually has one
         for i, card in enumerate(player.hand):
-            captures = self.find_captures(card, player)
-            if captures:
+            if self._has_any_capture(card):
+                captures = self.find_captures(card, player)
                 # Take the first capture option
                 return i, {'type': 'capture', 'target': captures[0]}
         
@@ -514,10 +833,11 @@ class SouthAfricanCasinoGame:
     
     def play_turn(self, player: Player):
         """Execute one player's turn"""
-        print(f"\n--- {player.name}'s turn ---")
-        print(f"Layout: {self.layout}")
-        print(f"Your hand: {player.hand}")
-        print(f"Your capture pile: {player.capture_pile[-3:] if player.capture_pile else []}")
+        if self.verbose:
+            self._log(f"\n--- {player.name}'s turn ---")
+            self._log(f"Layout: {self.layout}")
+            self._log(f"Your hand: {player.hand}")
+            self._log(f"Your capture pile: {player.capture_pile[-3:] if player.capture_pile else []}")
         
         # Reset turn tracking
         self.captures_this_turn = []
@@ -526,22 +846,23 @@ class SouthAfricanCasinoGame:
         if player.is_ai:
             card_index, action = self.get_ai_move(player)
             if card_index is None:
-                print("AI has no cards to play!")
+                self._log("AI has no cards to play!")
                 return
             played_card = player.play_card(card_index)
-            print(f"AI plays {played_card}")
+            if self.verbose:
+                self._log(f"AI plays {played_card}")
         else:
             # Human player
-            print("Choose a card to play (0-indexed):")
+            self._log("Choose a card to play (0-indexed):")
             for i, card in enumerate(player.hand):
-                print(f"{i}: {card}")
+                self._log(f"{i}: {card}")
             
             try:
                 card_index = int(input("Enter card number: "))
                 played_card = player.play_card(card_index)
-                print(f"You play {played_card}")
+                self._log(f"You play {played_card}")
             except (ValueError, IndexError):
-                print("Invalid choice, playing first card")
+                self._log("Invalid choice, playing first card")
                 played_card = player.play_card(0)
         
         # Check for possible actions
@@ -560,26 +881,26 @@ class SouthAfricanCasinoGame:
             return
         
         # For human player, show options
-        print("\nPossible actions:")
+        self._log("\nPossible actions:")
         actions = []
         
         # Capture options
         for i, capture_group in enumerate(possible_captures):
-            print(f"{len(actions)}: Capture {capture_group}")
+            self._log(f"{len(actions)}: Capture {capture_group}")
             actions.append(('capture', capture_group))
         
         # Build options
         for i, build_config in enumerate(possible_builds):
-            print(f"{len(actions)}: Create build {build_config}")
+            self._log(f"{len(actions)}: Create build {build_config}")
             actions.append(('build', build_config))
         
         # Augment options
         for i, augment_config in enumerate(possible_augments):
-            print(f"{len(actions)}: Augment build {augment_config}")
+            self._log(f"{len(actions)}: Augment build {augment_config}")
             actions.append(('augment', augment_config))
         
         # Discard option
-        print(f"{len(actions)}: Discard card")
+        self._log(f"{len(actions)}: Discard card")
         actions.append(('discard', None))
         
         if actions:
@@ -590,31 +911,31 @@ class SouthAfricanCasinoGame:
                     
                     if action_type == 'capture':
                         self.execute_capture(player, played_card, action_data)
-                        print(f"Captured {action_data}")
+                        self._log(f"Captured {action_data}")
                     elif action_type == 'build':
                         if self.execute_build(player, played_card, action_data):
-                            print(f"Created build: {action_data}")
+                            self._log(f"Created build: {action_data}")
                     elif action_type == 'augment':
                         if self.execute_build(player, played_card, action_data):
-                            print(f"Augmented build: {action_data}")
+                            self._log(f"Augmented build: {action_data}")
                     else:  # discard
                         self.discard_card(player, played_card)
                 else:
-                    print("Invalid choice, discarding")
+                    self._log("Invalid choice, discarding")
                     self.discard_card(player, played_card)
             except ValueError:
-                print("Invalid input, discarding")
+                self._log("Invalid input, discarding")
                 self.discard_card(player, played_card)
         else:
-            print("No actions available, discarding")
+            self._log("No actions available, discarding")
             self.discard_card(player, played_card)
     
-    def calculate_scores(self) -> Dict[int, int]:
+    def calculate_scores(self) -> List[int]:
         """
         Calculate scores according to South African Casino rules.
-        Returns dictionary of player_id -> score.
+        Returns list of scores indexed by player id.
         """
-        scores = {player.id: 0 for player in self.players}
+        scores = [0] * self.num_players
         
         if self.is_partnership_game or self.num_players == 2:
             # 2-player or partnership: 11 points total
@@ -627,31 +948,29 @@ class SouthAfricanCasinoGame:
             total_points = 7
         
         # Count cards and spades for each player/partnership
-        card_counts = defaultdict(int)
-        spade_counts = defaultdict(int)
-        special_scores = defaultdict(int)
-        
+        card_counts = {}
+        spade_counts = {}
+        special_scores = {}
+
+        team_key = self._team_key
         for player in self.players:
-            # For partnerships, combine counts
-            if self.is_partnership_game:
-                partner_id = self._get_partner_id(player.id)
-                key = tuple(sorted([player.id, partner_id]))
-            else:
-                key = player.id
-            
-            card_counts[key] += player.count_cards()
-            spade_counts[key] += player.count_spades()
-            
-            # Check for special cards
-            if player.has_card(self.spy_two) or self.spy_two in player.capture_pile:
-                special_scores[key] += 1
-            
-            if player.has_card(self.big_ten) or self.big_ten in player.capture_pile:
-                special_scores[key] += 2
-            
-            # Count aces
-            ace_count = sum(1 for card in player.capture_pile if card.rank == 'A')
-            special_scores[key] += ace_count
+            # For partnerships, both seats map to the shared team key
+            key = team_key[player.id]
+
+            card_counts[key] = card_counts.get(key, 0) + player.count_cards()
+            spade_counts[key] = spade_counts.get(key, 0) + player.count_spades()
+
+            # Aces read off the packed pile mask; the spy two and big ten
+            # also score while still held in a hand, so fall back to the
+            # (short) hand scan when the pile bit is clear
+            pile_mask = player.capture_mask
+            points = (pile_mask & _ACES_MASK).bit_count()
+            if pile_mask >> SPY_TWO.index & 1 or player.has_card(SPY_TWO):
+                points += 1
+            if pile_mask >> BIG_TEN.index & 1 or player.has_card(BIG_TEN):
+                points += 2
+            if points:
+                special_scores[key] = special_scores.get(key, 0) + points
         
         # Award points for most cards (if applicable)
         if total_points == 11:  # 2-player or partnership game
@@ -701,15 +1020,7 @@ class SouthAfricanCasinoGame:
     
     def _get_partner_id(self, player_id: int) -> Optional[int]:
         """Get partner ID for a player in partnership game"""
-        if not self.partnerships:
-            return None
-        
-        for p1, p2 in self.partnerships:
-            if p1 == player_id:
-                return p2
-            elif p2 == player_id:
-                return p1
-        return None
+        return self._partner_of[player_id]
     
     def check_game_over(self) -> bool:
         """Check if game is over (all hands empty)"""
@@ -734,59 +1045,87 @@ class SouthAfricanCasinoGame:
             
             if remaining_cards:
                 last_capturer.capture_cards(remaining_cards)
-                print(f"{last_capturer.name} captures remaining layout: {remaining_cards}")
+                if self.verbose:
+                    self._log(f"{last_capturer.name} captures remaining layout: {remaining_cards}")
             
             self.layout.clear()
+            self._loose.clear()
+            self._builds.clear()
+            self.loose_mask = 0
+            for bucket in self._loose_by_value:
+                bucket.clear()
     
-    def play_full_game(self):
-        """Play a complete game from start to finish"""
-        print("=" * 50)
-        print("Starting South African Casino Game!")
-        print("=" * 50)
-        
+    def _play_full_game_core(self) -> List[int]:
+        """
+        Play a complete game and return the scores, with no output of its
+        own. Self-play harnesses call this (paired with reset()) to run
+        rollouts without paying for any of the game-over formatting.
+        """
         self.setup_game()
-        
-        # Main game loop
+
+        # Main game loop. The per-game constants and hot bound methods are
+        # pinned to locals so the loop body pays no repeated attribute
+        # lookups -- the same effect a loop specialized per configuration
+        # would get, without generating code at runtime.
+        players = self.players
+        num_players = self.num_players
+        play_turn = self.play_turn
+        check_game_over = self.check_game_over
+        verbose = self.verbose
+
         round_num = 1
-        while not self.check_game_over():
-            print(f"\n{'='*30}")
-            print(f"Round {round_num}")
-            print(f"{'='*30}")
-            
+        while not check_game_over():
+            if verbose:
+                self._log(f"\n{_ROUND_BANNER}\nRound {round_num}\n{_ROUND_BANNER}")
+
             # Each player takes a turn
-            for i in range(self.num_players):
-                player = self.players[(self.current_player + i) % self.num_players]
+            current = self.current_player
+            for i in range(num_players):
+                player = players[(current + i) % num_players]
                 if player.hand:  # Only play if has cards
-                    self.play_turn(player)
-            
-            self.current_player = (self.current_player + 1) % self.num_players
+                    play_turn(player)
+
+            self.current_player = (current + 1) % num_players
             round_num += 1
-        
+
         # End of hand cleanup
         self.end_of_hand_cleanup()
-        
-        # Calculate scores
-        print("\n" + "="*50)
-        print("Game Over! Calculating scores...")
-        print("="*50)
-        
-        scores = self.calculate_scores()
-        
-        for player in self.players:
-            print(f"{player.name}:")
-            print(f"  Cards captured: {player.count_cards()}")
-            print(f"  Spades captured: {player.count_spades()}")
-            print(f"  Score: {scores[player.id]}")
-            print(f"  Capture pile: {player.capture_pile}")
-        
-        # Determine winner
-        max_score = max(scores.values())
-        winners = [player.name for player in self.players if scores[player.id] == max_score]
-        
+
+        return self.calculate_scores()
+
+    def play_full_game(self):
+        """Play a complete game from start to finish"""
+        self._log(_BANNER)
+        self._log("Starting South African Casino Game!")
+        self._log(_BANNER)
+
+        scores = self._play_full_game_core()
+
+        self._log("\n" + _BANNER)
+        self._log("Game Over! Calculating scores...")
+        self._log(_BANNER)
+
+        if self.verbose:
+            # Batch the per-player summary into one write
+            lines = []
+            for player in self.players:
+                lines.append(f"{player.name}:")
+                lines.append(f"  Cards captured: {player.count_cards()}")
+                lines.append(f"  Spades captured: {player.count_spades()}")
+                lines.append(f"  Score: {scores[player.id]}")
+                lines.append(f"  Capture pile: {_format_pile(player.capture_pile)}")
+            self._log("\n".join(lines))
+
+        # Determine winner: one pass over the scores list finds the tied
+        # indices directly
+        max_score = max(scores)
+        winners = [self.players[i].name
+                   for i, score in enumerate(scores) if score == max_score]
+
         if len(winners) == 1:
-            print(f"\n🎉 Winner: {winners[0]} with {max_score} points! 🎉")
+            self._log(f"\n🎉 Winner: {winners[0]} with {max_score} points! 🎉")
         else:
-            print(f"\n🤝 Tie between {', '.join(winners)} with {max_score} points each!")
+            self._log(f"\n🤝 Tie between {', '.join(winners)} with {max_score} points each!")
 
 # Example usage and test functions
 def run_example_game():
@@ -816,17 +1155,19 @@ def test_specific_scenario():
     
     # Manually set up a test scenario
     test_layout = [
-        Card('7', Suit.HEARTS),
-        Card('3', Suit.SPADES),
-        Card('4', Suit.DIAMONDS)
+        Card.get('7', HEARTS),
+        Card.get('3', SPADES),
+        Card.get('4', DIAMONDS)
     ]
-    game.layout = test_layout
-    
+    game.layout.extend(test_layout)
+    for card in test_layout:
+        game._add_loose(card)
+
     test_player = game.players[0]
-    test_player.hand = [Card('7', Suit.CLUBS), Card('A', Suit.HEARTS)]
+    test_player.hand = [Card.get('7', CLUBS), Card.get('A', HEARTS)]
     
     # Test captures
-    test_card = Card('7', Suit.CLUBS)
+    test_card = Card.get('7', CLUBS)
     captures = game.find_captures(test_card, test_player)
     print(f"Possible captures with {test_card}: {captures}")
     